@@ -5,22 +5,78 @@ and output as JSON API data.
 """
 
 import argparse
-import json
+import asyncio
 import os
 import re
+import sqlite3
 import sys
-import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
-import requests
-from bs4 import BeautifulSoup
+import aiohttp
+import lxml.html
+import orjson
+from lxml import etree
 
 BASE_URL = "https://lotto.thaiorc.com"
 LAO_LOTTERY_URL = f"{BASE_URL}/lao/lottery.php"
 LAO_STATS_LAST3_URL = f"{BASE_URL}/lao/last3/stats-years10.php"
 LAO_STATS_LAST2_URL = f"{BASE_URL}/lao/last2/stats-years10.php"
 
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+                  "AppleWebKit/537.36 (KHTML, like Gecko) "
+                  "Chrome/120.0.0.0 Safari/537.36",
+    "Accept-Language": "th,en;q=0.9",
+}
+
+# Default max concurrent requests to the server (--jobs); keeps the request rate polite
+DEFAULT_JOBS = 6
+
+# Retries for transient failures (connection errors, 429/5xx), with exponential backoff
+MAX_RETRIES = 3
+RETRY_BACKOFF = 0.3
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# On-disk cache of pages served with ETag/Last-Modified, revalidated each run
+HTTP_CACHE_PATH = ".http_cache.sqlite"
+_http_cache: Optional[sqlite3.Connection] = None
+
+# Pages are served as Thai windows-874 (cp874, a TIS-620 superset). Decode in
+# Python with errors="replace": libxml2's own decoder silently drops the rest of
+# the page at the first undefined byte (0xDB-0xDE, 0xFC-0xFF)
+PAGE_ENCODING = "cp874"
+
+# Precompiled patterns used while parsing rows
+_CONTENT_ID_RE = re.compile(r"contentID=(\d+)")
+_DIGIT_LABEL_RE = re.compile(r"(\d)")
+
+# Result rows: 4 cells, the first with class stats-title (not the stats-title3
+# header) and a date link
+_RESULT_ROWS_XPATH = etree.XPath(
+    "//tr[count(.//td) = 4]"
+    "[(.//td)[1][contains(concat(' ', normalize-space(@class), ' '), ' stats-title ')]"
+    "[not(contains(concat(' ', normalize-space(@class), ' '), ' stats-title3 '))]"
+    "[.//a]]"
+)
+
+# Table enclosing the first "จำนวนครั้ง" header cell (frequency distribution).
+# normalize-space() only trims ASCII whitespace, so map &nbsp; to a space first
+# (str.strip() in the old text comparison removed it too)
+_FREQ_TABLE_XPATH = etree.XPath(
+    "(//td[normalize-space(translate(., $nbsp, ' '))=$header])[1]/ancestor::table[1]"
+)
+
+# Rate cells in a digit-position row (class stats-rate0, stats-rate1, ...)
+_STATS_RATE_XPATH = etree.XPath(".//font[starts-with(@class, 'stats-rate')]")
+
+# <font> tags of the never-drawn container div (one number per font)
+_NEVER_DRAWN_XPATH = etree.XPath("(//div[@id=$div_id])[1]//font")
+
+# Threads used to write the per-date JSON files
+JSON_WRITE_WORKERS = 8
+
 # Thai month names to month numbers
 THAI_MONTHS = {
     "มกราคม": 1, "กุมภาพันธ์": 2, "มีนาคม": 3, "เมษายน": 4,
@@ -29,17 +85,92 @@ THAI_MONTHS = {
 }
 
 
-def fetch_page(url: str) -> BeautifulSoup:
-    """Fetch a page and return a BeautifulSoup object."""
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-                      "AppleWebKit/537.36 (KHTML, like Gecko) "
-                      "Chrome/120.0.0.0 Safari/537.36",
-        "Accept-Language": "th,en;q=0.9",
-    }
-    response = requests.get(url, headers=headers, timeout=30)
-    response.encoding = "tis-620"  # Thai encoding (windows-874 compatible)
-    return BeautifulSoup(response.text, "html.parser")
+def _get_http_cache() -> sqlite3.Connection:
+    """Open (and create if needed) the on-disk HTTP cache."""
+    global _http_cache
+    if _http_cache is None:
+        _http_cache = sqlite3.connect(HTTP_CACHE_PATH)
+        _http_cache.execute(
+            "CREATE TABLE IF NOT EXISTS pages "
+            "(url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, body BLOB)"
+        )
+    return _http_cache
+
+
+def _load_cached_page(url: str) -> Tuple[Dict[str, str], Optional[bytes]]:
+    """Return conditional request headers and the cached body for url, if any."""
+    row = _get_http_cache().execute(
+        "SELECT etag, last_modified, body FROM pages WHERE url = ?", (url,)
+    ).fetchone()
+    if row is None:
+        return {}, None
+
+    etag, last_modified, body = row
+    headers = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+    return headers, body
+
+
+def _store_cached_page(url: str, headers, body: bytes) -> None:
+    """
+    Cache a 200 response body for url if the server sent validators to revalidate it with.
+    Without validators any older entry is dropped so its stale validators are not resent.
+    """
+    etag = headers.get("ETag")
+    last_modified = headers.get("Last-Modified")
+
+    cache = _get_http_cache()
+    if not etag and not last_modified:
+        cache.execute("DELETE FROM pages WHERE url = ?", (url,))
+    else:
+        cache.execute(
+            "INSERT OR REPLACE INTO pages (url, etag, last_modified, body) VALUES (?, ?, ?, ?)",
+            (url, etag, last_modified, body),
+        )
+    cache.commit()
+
+
+async def fetch_page_async(
+    session: aiohttp.ClientSession, semaphore: asyncio.Semaphore, url: str
+) -> lxml.html.HtmlElement:
+    """
+    Fetch a page using the shared aiohttp session and return the parsed lxml document.
+    semaphore: bounds the number of requests in flight across the whole run
+    """
+    cache_headers, cached_body = _load_cached_page(url)
+    for attempt in range(MAX_RETRIES + 1):
+        if attempt:
+            await asyncio.sleep(RETRY_BACKOFF * 2 ** (attempt - 1))
+        try:
+            async with semaphore, session.get(url, headers=cache_headers) as response:
+                if response.status in RETRY_STATUSES:
+                    if attempt < MAX_RETRIES:
+                        continue
+                    # Out of retries: fail instead of parsing the error page
+                    response.raise_for_status()
+                if response.status == 304 and cached_body is not None:
+                    body = cached_body
+                else:
+                    body = await response.read()
+                    # Never cache error pages: a later 304 would keep serving them
+                    if response.status == 200:
+                        _store_cached_page(url, response.headers, body)
+                break
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            if attempt == MAX_RETRIES:
+                raise
+    return lxml.html.document_fromstring(body.decode(PAGE_ENCODING, errors="replace"))
+
+
+def _text(element: lxml.html.HtmlElement) -> str:
+    """Concatenate the stripped text nodes under element."""
+    # Most cells are leaves holding a single text node: skip the subtree walk
+    if len(element) == 0:
+        return (element.text or "").strip()
+    return "".join(t.strip() for t in element.itertext())
 
 
 def parse_thai_date(date_str: str) -> str:
@@ -47,7 +178,13 @@ def parse_thai_date(date_str: str) -> str:
     Convert Thai Buddhist date dd/mm/yyyy (BE) to ISO date yyyy-mm-dd (CE).
     Example: 06/02/2569 -> 2026-02-06
     """
-    parts = date_str.strip().split("/")
+    date = date_str.strip()
+    # Fast path for the usual zero-padded form: slice instead of split + int()
+    if (len(date) == 10 and date[2] == "/" and date[5] == "/" and date.isascii()
+            and date[:2].isdigit() and date[3:5].isdigit()):
+        return f"{int(date[6:]) - 543:04d}-{date[3:5]}-{date[:2]}"
+
+    parts = date.split("/")
     if len(parts) != 3:
         return date_str
     day, month, year_be = int(parts[0]), int(parts[1]), int(parts[2])
@@ -55,45 +192,34 @@ def parse_thai_date(date_str: str) -> str:
     return f"{year_ce:04d}-{month:02d}-{day:02d}"
 
 
-def scrape_lottery_results() -> List[Dict]:
+async def scrape_lottery_results_async(
+    session: aiohttp.ClientSession, semaphore: asyncio.Semaphore
+) -> List[Dict]:
     """Scrape the main lottery results page."""
-    soup = fetch_page(LAO_LOTTERY_URL)
-    results = []
+    return parse_lottery_results(await fetch_page_async(session, semaphore, LAO_LOTTERY_URL))
 
-    # Find all table rows that contain lottery data
-    # The data is in <tr> elements with <td class="...stats-title...">
-    rows = soup.find_all("tr")
-
-    for row in rows:
-        cells = row.find_all("td")
-        if len(cells) != 4:
-            continue
 
-        # Check if this row has the stats-title class (data row)
-        first_cell = cells[0]
-        if "stats-title" not in first_cell.get("class", []):
-            continue
+def parse_lottery_results(tree) -> List[Dict]:
+    """Parse the lottery result rows from the main results page."""
+    results = []
 
-        # Skip header rows (stats-title3)
-        if "stats-title3" in first_cell.get("class", []):
-            continue
+    # Data rows are <tr> elements with <td class="...stats-title..."> (see _RESULT_ROWS_XPATH)
+    for row in _RESULT_ROWS_XPATH(tree):
+        cells = row.findall(".//td")
 
         # Extract date from the link
-        link = first_cell.find("a")
-        if not link:
-            continue
-
-        date_thai = link.get_text(strip=True)
+        link = cells[0].find(".//a")
+        date_thai = _text(link)
         date_iso = parse_thai_date(date_thai)
 
         # Extract numbers
-        num4 = cells[1].get_text(strip=True)
-        num3 = cells[2].get_text(strip=True)
-        num2 = cells[3].get_text(strip=True)
+        num4 = _text(cells[1])
+        num3 = _text(cells[2])
+        num2 = _text(cells[3])
 
         # Extract contentID for detail link
         href = link.get("href", "")
-        content_id_match = re.search(r"contentID=(\d+)", href)
+        content_id_match = _CONTENT_ID_RE.search(href)
         content_id = content_id_match.group(1) if content_id_match else None
 
         results.append({
@@ -110,7 +236,7 @@ def scrape_lottery_results() -> List[Dict]:
     return results
 
 
-def scrape_digit_position_stats(soup, num_digits: int) -> Dict:
+def scrape_digit_position_stats(tree, num_digits: int) -> Dict:
     """
     Parse the 'แยกตามหลัก' (digit position) statistics table.
     For 3-digit: หลักร้อย, หลักสิบ, หลักหน่วย
@@ -119,22 +245,22 @@ def scrape_digit_position_stats(soup, num_digits: int) -> Dict:
     digit_stats = {}
 
     # Find rows with stats-number class (เลข 0 - เลข 9)
-    stats_number_fonts = soup.find_all("font", class_="stats-number")
+    stats_number_fonts = [f for f in tree.find_class("stats-number") if f.tag == "font"]
 
     for font_tag in stats_number_fonts:
-        label = font_tag.get_text(strip=True)  # e.g. "เลข 0"
-        digit_match = re.search(r"(\d)", label)
+        label = _text(font_tag)  # e.g. "เลข 0"
+        digit_match = _DIGIT_LABEL_RE.search(label)
         if not digit_match:
             continue
 
         digit = digit_match.group(1)
         # Navigate to parent row and get all rate values
-        row = font_tag.find_parent("tr")
-        if not row:
+        row = next(font_tag.iterancestors("tr"), None)
+        if row is None:
             continue
 
-        rate_fonts = row.find_all("font", class_=re.compile(r"stats-rate\d"))
-        values = [int(f.get_text(strip=True)) for f in rate_fonts]
+        rate_fonts = _STATS_RATE_XPATH(row)
+        values = [int(_text(f)) for f in rate_fonts]
 
         if num_digits == 3 and len(values) == 4:
             digit_stats[digit] = {
@@ -153,42 +279,31 @@ def scrape_digit_position_stats(soup, num_digits: int) -> Dict:
     return digit_stats
 
 
-def scrape_frequency_distribution(soup) -> Dict[str, List[str]]:
+def scrape_frequency_distribution(tree) -> Dict[str, List[str]]:
     """
     Parse the 'แบ่งตามจำนวนครั้งที่ออก' (frequency distribution) table.
     Returns dict of frequency -> list of numbers.
     """
     frequency = {}
 
-    # Find the header td with exact text "จำนวนครั้ง"
-    header_td = None
-    for td in soup.find_all("td"):
-        if td.get_text(strip=True) == "จำนวนครั้ง":
-            header_td = td
-            break
-
-    if not header_td:
-        return frequency
-
-    freq_table = header_td.find_parent("table")
-    if not freq_table:
+    # Find the table around the header td with exact text "จำนวนครั้ง"
+    freq_tables = _FREQ_TABLE_XPATH(tree, header="จำนวนครั้ง", nbsp="\u00a0")
+    if not freq_tables:
         return frequency
 
-    rows = freq_table.find_all("tr")
-    for row in rows:
-        cells = row.find_all("td")
+    for row in freq_tables[0].iter("tr"):
+        cells = row.findall(".//td")
         if len(cells) != 2:
             continue
 
         # First cell is frequency count, second cell has numbers
-        freq_text = cells[0].get_text(strip=True)
+        freq_text = _text(cells[0])
         if not freq_text.isdigit():
             continue
 
         freq_count = freq_text
         # Extract numbers from font tags in the second cell
-        number_fonts = cells[1].find_all("font")
-        numbers = [f.get_text(strip=True) for f in number_fonts if f.get_text(strip=True)]
+        numbers = [t for t in (_text(f) for f in cells[1].iter("font")) if t]
 
         if numbers:
             frequency[freq_count] = numbers
@@ -196,131 +311,123 @@ def scrape_frequency_distribution(soup) -> Dict[str, List[str]]:
     return frequency
 
 
-def scrape_never_drawn(soup, num_digits: int) -> List[str]:
+def scrape_never_drawn(tree, num_digits: int) -> List[str]:
     """
     Parse the 'เลขที่ยังไม่ออก' (numbers never drawn) section.
     """
-    never_drawn = []
-
-    # Find the div that contains never-drawn numbers
-    div_id = f"statslast{num_digits}All"
-    container = soup.find("div", id=div_id)
-    if not container:
-        return never_drawn
-
-    # Extract numbers from font tags
-    number_fonts = container.find_all("font")
-    never_drawn = [f.get_text(strip=True) for f in number_fonts if f.get_text(strip=True)]
-
-    return never_drawn
-
-
-def scrape_stats_last3() -> Dict:
-    """Scrape 3-digit statistics from stats-years10 page."""
-    print("Scraping 3-digit stats (เลข 3 ตัว)...")
-    soup = fetch_page(LAO_STATS_LAST3_URL)
-
-    # Extract total draws count
-    meta_desc = soup.find("meta", attrs={"name": "description"})
-    description = meta_desc["content"] if meta_desc else ""
+    # Numbers are the font texts inside the statslast{N}All div
+    number_fonts = _NEVER_DRAWN_XPATH(tree, div_id=f"statslast{num_digits}All")
+    return [t for t in (_text(f) for f in number_fonts) if t]
 
-    digit_stats = scrape_digit_position_stats(soup, 3)
-    frequency = scrape_frequency_distribution(soup)
-    never_drawn = scrape_never_drawn(soup, 3)
 
-    return {
-        "description": description,
-        "digit_position_stats": digit_stats,
-        "frequency_distribution": frequency,
-        "never_drawn": never_drawn,
-        "never_drawn_count": len(never_drawn),
+def _parse_stats_page(tree, num_digits: int, include_never_drawn: bool) -> Dict:
+    """Parse the statistics tables shared by the stats-years10 and stats-date pages."""
+    stats = {
+        "digit_position_stats": scrape_digit_position_stats(tree, num_digits),
+        "frequency_distribution": scrape_frequency_distribution(tree),
     }
+    if include_never_drawn:
+        never_drawn = scrape_never_drawn(tree, num_digits)
+        stats["never_drawn"] = never_drawn
+        stats["never_drawn_count"] = len(never_drawn)
+    return stats
 
 
-def scrape_stats_last2() -> Dict:
-    """Scrape 2-digit statistics from stats-years10 page."""
-    print("Scraping 2-digit stats (เลข 2 ตัว)...")
-    soup = fetch_page(LAO_STATS_LAST2_URL)
+async def scrape_stats_years10_async(
+    session: aiohttp.ClientSession, semaphore: asyncio.Semaphore, num_digits: int
+) -> Dict:
+    """
+    Scrape 10-year statistics from the stats-years10 page.
+    num_digits: 3 for last3, 2 for last2
+    """
+    print(f"Scraping {num_digits}-digit stats (เลข {num_digits} ตัว)...")
+    url = LAO_STATS_LAST3_URL if num_digits == 3 else LAO_STATS_LAST2_URL
+    tree = await fetch_page_async(session, semaphore, url)
 
     # Extract total draws count
-    meta_desc = soup.find("meta", attrs={"name": "description"})
-    description = meta_desc["content"] if meta_desc else ""
-
-    digit_stats = scrape_digit_position_stats(soup, 2)
-    frequency = scrape_frequency_distribution(soup)
-    never_drawn = scrape_never_drawn(soup, 2)
+    meta_desc = tree.find('.//meta[@name="description"]')
+    description = meta_desc.get("content", "") if meta_desc is not None else ""
 
     return {
         "description": description,
-        "digit_position_stats": digit_stats,
-        "frequency_distribution": frequency,
-        "never_drawn": never_drawn,
-        "never_drawn_count": len(never_drawn),
+        **_parse_stats_page(tree, num_digits, include_never_drawn=True),
     }
 
 
-def scrape_stats_by_date(num_digits: int) -> Dict[str, Dict]:
+async def scrape_stats_by_date_async(
+    session: aiohttp.ClientSession, semaphore: asyncio.Semaphore, num_digits: int
+) -> Dict[str, Dict]:
     """
     Scrape statistics by date of month (1-31).
     num_digits: 3 for last3, 2 for last2
     URL pattern:
       3-digit: /lao/last3/stats-date{d}.php?ay=2559
       2-digit: /lao/last2/stats-date{d}.php?ay=2559
+    The 31 pages are fetched concurrently, bounded by the shared semaphore.
     """
     label = f"เลข {num_digits} ตัว"
     path_segment = f"last{num_digits}"
     print(f"Scraping stats by date ({label}) วันที่ 1-31...")
 
-    all_dates = {}
-    for day in range(1, 32):
+    days = range(1, 32)
+    done = 0
+
+    async def scrape_day(day: int) -> Dict:
+        nonlocal done
         url = f"{BASE_URL}/lao/{path_segment}/stats-date{day}.php?ay=2559"
-        try:
-            soup = fetch_page(url)
-            digit_stats = scrape_digit_position_stats(soup, num_digits)
-            frequency = scrape_frequency_distribution(soup)
-
-            all_dates[str(day)] = {
-                "date": day,
-                "digit_position_stats": digit_stats,
-                "frequency_distribution": frequency,
-                "source_url": url,
-            }
+        tree = await fetch_page_async(session, semaphore, url)
+        stats = _parse_stats_page(tree, num_digits, include_never_drawn=False)
 
-            sys.stdout.write(f"\r  วันที่ {day}/31 ...")
-            sys.stdout.flush()
+        done += 1
+        sys.stdout.write(f"\r  {label} วันที่ {done}/31 ...")
+        sys.stdout.flush()
 
-            # Small delay to be polite to the server
-            if day < 31:
-                time.sleep(0.3)
-        except Exception as e:
-            print(f"\n  Error on date {day}: {e}", file=sys.stderr)
+        return {
+            "date": day,
+            **stats,
+            "source_url": url,
+        }
+
+    pages = await asyncio.gather(
+        *(scrape_day(day) for day in days),
+        return_exceptions=True,
+    )
+
+    all_dates = {}
+    for day, page in zip(days, pages):
+        if isinstance(page, Exception):
+            print(f"\n  Error on date {day}: {page}", file=sys.stderr)
             continue
+        all_dates[str(day)] = page
 
-    print(f"\r  วันที่ 1-31 เสร็จ ({len(all_dates)} วัน)")
+    print(f"\r  {label} วันที่ 1-31 เสร็จ ({len(all_dates)} วัน)")
     return all_dates
 
 
-def save_json(data, filepath: str) -> None:
-    """Save data as JSON file."""
+def save_json(data, filepath: str, pretty: bool = False) -> None:
+    """
+    Save data as JSON file.
+    pretty: indent the output; otherwise write compact JSON
+    """
     os.makedirs(os.path.dirname(filepath), exist_ok=True)
-    with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    _write_json(data, filepath, pretty)
     print(f"Saved: {filepath}")
 
 
-def scrape_latest_only():
-    """Scrape only the latest lottery results (latest, results, year files)."""
-    print("Mode: latest - Scraping Lao Lottery results only...")
-    results = scrape_lottery_results()
-
-    if not results:
-        print("No results found!", file=sys.stderr)
-        sys.exit(1)
+def _write_json(data, filepath: str, pretty: bool = False) -> None:
+    """Write data to filepath, whose directory must already exist (no output, thread-safe)."""
+    option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+    payload = orjson.dumps(data, option=option)
 
-    print(f"Found {len(results)} results")
+    # Write to a temp file and swap it in so readers never see a partial file
+    tmp_path = f"{filepath}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(payload)
+    os.replace(tmp_path, filepath)
 
-    now = datetime.utcnow().isoformat() + "Z"
 
+def _write_results_outputs(results: List[Dict], now: str) -> Dict[str, List]:
+    """Write latest.json, results.json and the per-year files; return results by year."""
     # 1. Latest result
     latest = {
         "status": "ok",
@@ -328,7 +435,7 @@ def scrape_latest_only():
         "source": LAO_LOTTERY_URL,
         "data": results[0] if results else None,
     }
-    save_json(latest, "api/latest.json")
+    save_json(latest, "api/latest.json", pretty=True)
 
     # 2. All recent results
     all_results = {
@@ -357,15 +464,87 @@ def scrape_latest_only():
         }
         save_json(year_data, f"api/year/{year}.json")
 
+    return by_year
+
+
+def _write_stats_outputs(stats: Dict, num_digits: int, now: str) -> None:
+    """Write api/stats/last{N}.json from the stats-years10 data."""
+    stats_data = {
+        "status": "ok",
+        "updated_at": now,
+        "source": LAO_STATS_LAST3_URL if num_digits == 3 else LAO_STATS_LAST2_URL,
+        "period": "10 ปีย้อนหลัง",
+        "data": stats,
+    }
+    save_json(stats_data, f"api/stats/last{num_digits}.json")
+    print(f"  - แยกตามหลัก: {len(stats['digit_position_stats'])} หลัก")
+    print(f"  - แบ่งตามจำนวนครั้ง: {len(stats['frequency_distribution'])} กลุ่ม")
+    print(f"  - เลขที่ยังไม่ออก: {stats['never_drawn_count']} เลข")
+
+
+def _write_stats_by_date_outputs(stats_by_date: Dict[str, Dict], num_digits: int, now: str) -> None:
+    """Write api/stats/last{N}-by-date.json and the per-date files."""
+    by_date_data = {
+        "status": "ok",
+        "updated_at": now,
+        "source": f"{BASE_URL}/lao/last{num_digits}/stats-date{{1-31}}.php",
+        "period": "10 ปีย้อนหลัง",
+        "count": len(stats_by_date),
+        "data": stats_by_date,
+    }
+    save_json(by_date_data, f"api/stats/last{num_digits}-by-date.json")
+
+    # Per-date files are small and independent: create the directory once and
+    # write them from a thread pool so the file syscalls overlap
+    day_dir = f"api/stats/last{num_digits}"
+    os.makedirs(day_dir, exist_ok=True)
+    day_files = [
+        ({
+            "status": "ok",
+            "updated_at": now,
+            "date": int(day),
+            "period": "10 ปีย้อนหลัง",
+            "data": day_data,
+        }, f"{day_dir}/date{day}.json")
+        for day, day_data in stats_by_date.items()
+    ]
+    with ThreadPoolExecutor(max_workers=JSON_WRITE_WORKERS) as executor:
+        list(executor.map(lambda item: _write_json(*item), day_files))
+    # Report from the main thread so log lines from the workers don't interleave
+    for _, filepath in day_files:
+        print(f"Saved: {filepath}")
+
+
+async def scrape_latest_only(session: aiohttp.ClientSession, semaphore: asyncio.Semaphore):
+    """Scrape only the latest lottery results (latest, results, year files)."""
+    print("Mode: latest - Scraping Lao Lottery results only...")
+    results = await scrape_lottery_results_async(session, semaphore)
+
+    if not results:
+        print("No results found!", file=sys.stderr)
+        sys.exit(1)
+
+    print(f"Found {len(results)} results")
+
+    now = datetime.utcnow().isoformat() + "Z"
+    by_year = _write_results_outputs(results, now)
+
     # Update index
     _save_index(now, by_year)
     print("Done! (latest only)")
 
 
-def scrape_full():
+async def scrape_full(session: aiohttp.ClientSession, semaphore: asyncio.Semaphore):
     """Scrape everything: results + all statistics."""
     print("Mode: full - Scraping all Lao Lottery data...")
-    results = scrape_lottery_results()
+    # All pages are independent, so fetch them concurrently
+    results, stats_last3, stats_last2, stats_by_date_3, stats_by_date_2 = await asyncio.gather(
+        scrape_lottery_results_async(session, semaphore),
+        scrape_stats_years10_async(session, semaphore, 3),
+        scrape_stats_years10_async(session, semaphore, 2),
+        scrape_stats_by_date_async(session, semaphore, 3),
+        scrape_stats_by_date_async(session, semaphore, 2),
+    )
 
     if not results:
         print("No results found!", file=sys.stderr)
@@ -375,109 +554,20 @@ def scrape_full():
 
     now = datetime.utcnow().isoformat() + "Z"
 
-    # 1. Latest result
-    latest = {
-        "status": "ok",
-        "updated_at": now,
-        "source": LAO_LOTTERY_URL,
-        "data": results[0] if results else None,
-    }
-    save_json(latest, "api/latest.json")
-
-    # 2. All recent results
-    all_results = {
-        "status": "ok",
-        "updated_at": now,
-        "source": LAO_LOTTERY_URL,
-        "count": len(results),
-        "data": results,
-    }
-    save_json(all_results, "api/results.json")
-
-    # 3. Results grouped by year
-    by_year: Dict[str, List] = {}
-    for r in results:
-        year = r["date"][:4]
-        by_year.setdefault(year, []).append(r)
-
-    for year, year_results in by_year.items():
-        year_data = {
-            "status": "ok",
-            "updated_at": now,
-            "source": LAO_LOTTERY_URL,
-            "year": year,
-            "count": len(year_results),
-            "data": year_results,
-        }
-        save_json(year_data, f"api/year/{year}.json")
+    # 1-3. Latest, all results, results by year
+    by_year = _write_results_outputs(results, now)
 
     # 4. Stats: 3-digit (เลข 3 ตัว)
-    stats_last3 = scrape_stats_last3()
-    stats3_data = {
-        "status": "ok",
-        "updated_at": now,
-        "source": LAO_STATS_LAST3_URL,
-        "period": "10 ปีย้อนหลัง",
-        "data": stats_last3,
-    }
-    save_json(stats3_data, "api/stats/last3.json")
-    print(f"  - แยกตามหลัก: {len(stats_last3['digit_position_stats'])} หลัก")
-    print(f"  - แบ่งตามจำนวนครั้ง: {len(stats_last3['frequency_distribution'])} กลุ่ม")
-    print(f"  - เลขที่ยังไม่ออก: {stats_last3['never_drawn_count']} เลข")
+    _write_stats_outputs(stats_last3, 3, now)
 
     # 5. Stats: 2-digit (เลข 2 ตัว)
-    stats_last2 = scrape_stats_last2()
-    stats2_data = {
-        "status": "ok",
-        "updated_at": now,
-        "source": LAO_STATS_LAST2_URL,
-        "period": "10 ปีย้อนหลัง",
-        "data": stats_last2,
-    }
-    save_json(stats2_data, "api/stats/last2.json")
-    print(f"  - แยกตามหลัก: {len(stats_last2['digit_position_stats'])} หลัก")
-    print(f"  - แบ่งตามจำนวนครั้ง: {len(stats_last2['frequency_distribution'])} กลุ่ม")
-    print(f"  - เลขที่ยังไม่ออก: {stats_last2['never_drawn_count']} เลข")
+    _write_stats_outputs(stats_last2, 2, now)
 
     # 6. Stats by date: 3-digit (เลข 3 ตัว ตามวันที่ออก 1-31)
-    stats_by_date_3 = scrape_stats_by_date(3)
-    by_date3_data = {
-        "status": "ok",
-        "updated_at": now,
-        "source": "https://lotto.thaiorc.com/lao/last3/stats-date{1-31}.php",
-        "period": "10 ปีย้อนหลัง",
-        "count": len(stats_by_date_3),
-        "data": stats_by_date_3,
-    }
-    save_json(by_date3_data, "api/stats/last3-by-date.json")
-    for day, day_data in stats_by_date_3.items():
-        save_json({
-            "status": "ok",
-            "updated_at": now,
-            "date": int(day),
-            "period": "10 ปีย้อนหลัง",
-            "data": day_data,
-        }, f"api/stats/last3/date{day}.json")
+    _write_stats_by_date_outputs(stats_by_date_3, 3, now)
 
     # 7. Stats by date: 2-digit (เลข 2 ตัว ตามวันที่ออก 1-31)
-    stats_by_date_2 = scrape_stats_by_date(2)
-    by_date2_data = {
-        "status": "ok",
-        "updated_at": now,
-        "source": "https://lotto.thaiorc.com/lao/last2/stats-date{1-31}.php",
-        "period": "10 ปีย้อนหลัง",
-        "count": len(stats_by_date_2),
-        "data": stats_by_date_2,
-    }
-    save_json(by_date2_data, "api/stats/last2-by-date.json")
-    for day, day_data in stats_by_date_2.items():
-        save_json({
-            "status": "ok",
-            "updated_at": now,
-            "date": int(day),
-            "period": "10 ปีย้อนหลัง",
-            "data": day_data,
-        }, f"api/stats/last2/date{day}.json")
+    _write_stats_by_date_outputs(stats_by_date_2, 2, now)
 
     # 8. Index
     _save_index(now, by_year)
@@ -503,7 +593,21 @@ def _save_index(now: str, by_year: Dict[str, List]) -> None:
             "stats_last2_date": [f"api/stats/last2/date{d}.json" for d in range(1, 32)],
         },
     }
-    save_json(index, "api/index.json")
+    save_json(index, "api/index.json", pretty=True)
+
+
+async def run(mode: str, jobs: int) -> None:
+    """Run the given mode with one aiohttp session shared by every fetch."""
+    async with aiohttp.ClientSession(
+        headers=HEADERS,
+        timeout=aiohttp.ClientTimeout(total=30),
+        connector=aiohttp.TCPConnector(limit=jobs, ttl_dns_cache=300),
+    ) as session:
+        semaphore = asyncio.Semaphore(jobs)
+        if mode == "latest":
+            await scrape_latest_only(session, semaphore)
+        else:
+            await scrape_full(session, semaphore)
 
 
 def main():
@@ -514,12 +618,17 @@ def main():
         default="full",
         help="Scraping mode: 'full' = all data + stats, 'latest' = results only (default: full)",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=DEFAULT_JOBS,
+        help=f"Max concurrent requests to the server (default: {DEFAULT_JOBS})",
+    )
     args = parser.parse_args()
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
 
-    if args.mode == "latest":
-        scrape_latest_only()
-    else:
-        scrape_full()
+    asyncio.run(run(args.mode, args.jobs))
 
 
 if __name__ == "__main__":